@@ -5,14 +5,106 @@ POST/PUT/PATCH request bodies, extracts text from common JSON fields,
 and runs it through a :class:`~llm_shelter.pipeline.GuardrailPipeline`.
 Blocked requests receive a 422 response; redacted text is forwarded to
 the application with the modified body.
+
+When the optional ``orjson`` package is installed (``pip install
+llm-shelter[fast]``), request bodies are parsed and serialized with it.
 """
 
 from __future__ import annotations
 
 import json
+import re
 from typing import Any, Callable
 
-from llm_shelter.pipeline import Action, GuardrailPipeline, ValidationResult
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _HAVE_ORJSON = False
+
+from llm_shelter.pipeline import Action, Finding, GuardrailPipeline, ValidationResult
+from llm_shelter.validators.length import LengthValidator
+
+_TEXT_KEYS = ("text", "message", "content", "prompt", "input", "query")
+
+_QUOTED_TEXT_KEYS = tuple(f'"{key}"'.encode() for key in _TEXT_KEYS)
+
+_GUARDED_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
+# orjson silently turns integers wider than 64 bits into floats, which
+# would corrupt them when a redacted body is re-serialized.
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
+_JSON_OBJECT_START = re.compile(rb"(?:\xef\xbb\xbf)?[ \t\n\r]*\{")
+
+# Returned by every receive after the body has been replayed. Shared
+# across requests, so it must never be mutated.
+_EMPTY_MSG: dict[str, Any] = {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _is_wide_encoding(raw: bytes | bytearray) -> bool:
+    """Return whether *raw* looks like UTF-16/32, which the stdlib parser accepts."""
+    return raw[:2] in (b"\xff\xfe", b"\xfe\xff") or b"\x00" in raw[:4]
+
+
+def _may_be_json_object(raw: bytes | bytearray) -> bool:
+    """Return whether *raw* could be a JSON object, BOM-prefixed or UTF-16/32 included."""
+    return _is_wide_encoding(raw) or _JSON_OBJECT_START.match(raw) is not None
+
+
+def _may_hold_text_key(raw: bytes | bytearray) -> bool:
+    """Cheaply check whether *raw* could be JSON with one of the text keys.
+
+    ``False`` is only returned for UTF-8 bodies in which no key appears
+    literally and no ``\\u`` escape could spell one, so such bodies can be
+    validated whole without parsing them. UTF-16/32 bodies (which the
+    stdlib parser accepts) always return ``True``.
+    """
+    if _is_wide_encoding(raw):
+        return True
+    return b"\\u" in raw or any(key in raw for key in _QUOTED_TEXT_KEYS)
+
+
+def _loads(raw: bytes | bytearray) -> tuple[Any, bool]:
+    """Parse JSON bytes, preferring orjson when it can represent the body exactly.
+
+    Returns the payload and whether orjson parsed it. Only such payloads
+    may be written back with orjson: the stdlib fallback also accepts NaN
+    and Infinity, which orjson would serialize as ``null``.
+    """
+    if _HAVE_ORJSON and not _LONG_DIGIT_RUN.search(raw):
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            pass  # the stdlib also accepts NaN and Infinity
+    return json.loads(raw), False
+
+
+def _dumps(obj: Any, fast: bool = True) -> bytes:
+    """Serialize *obj* to JSON bytes, preferring orjson unless *fast* is False."""
+    if _HAVE_ORJSON and fast:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return json.dumps(obj).encode("utf-8")
+
+
+class _OneShotReceive:
+    """ASGI receive callable that replays a buffered body exactly once."""
+
+    __slots__ = ("body", "sent")
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.sent = False
+
+    async def __call__(self) -> dict[str, Any]:
+        if self.sent:
+            return _EMPTY_MSG
+        self.sent = True
+        return {"type": "http.request", "body": self.body, "more_body": False}
 
 
 class ShelterMiddleware:
@@ -33,6 +125,9 @@ class ShelterMiddleware:
         pipeline: A configured GuardrailPipeline.
         paths: Optional list of URL paths to guard. Guards all POST/PUT/PATCH if None.
         on_block: Optional callback(scope, result) returning a custom response body.
+        max_body_bytes: Optional cap on the request body size. Bodies larger
+            than this are rejected while they are still being received, so
+            oversized uploads are never buffered or scanned.
     """
 
     def __init__(
@@ -41,11 +136,17 @@ class ShelterMiddleware:
         pipeline: GuardrailPipeline,
         paths: list[str] | None = None,
         on_block: Callable[..., dict[str, Any]] | None = None,
+        max_body_bytes: int | None = None,
     ) -> None:
+        if max_body_bytes is not None and max_body_bytes < 0:
+            raise ValueError(f"max_body_bytes must be >= 0, got {max_body_bytes}")
         self.app = app
         self.pipeline = pipeline
-        self.paths = paths
+        # Hashed once so the per-request path check is O(1); an empty list
+        # guards every path, as None does.
+        self.paths: frozenset[str] | None = frozenset(paths) if paths else None
         self.on_block = on_block
+        self.max_body_bytes = max_body_bytes
 
     async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
         """ASGI entry point. Intercepts HTTP requests and applies guardrails."""
@@ -56,39 +157,50 @@ class ShelterMiddleware:
         method = scope.get("method", "GET")
         path = scope.get("path", "")
 
-        if method not in ("POST", "PUT", "PATCH"):
+        if method not in _GUARDED_METHODS:
             await self.app(scope, receive, send)
             return
 
-        if self.paths and path not in self.paths:
+        if self.paths is not None and path not in self.paths:
             await self.app(scope, receive, send)
             return
 
-        # Collect body
-        body_parts: list[bytes] = []
+        # Collect body, giving up early once it exceeds max_body_bytes. A
+        # single-chunk body is kept as is; later chunks extend one buffer.
+        raw_body: bytes | bytearray = b""
+        total = 0
         while True:
             message = await receive()
-            body_parts.append(message.get("body", b""))
-            if not message.get("more_body", False):
+            chunk = message.get("body", b"")
+            total += len(chunk)
+            more_body = message.get("more_body", False)
+            if self.max_body_bytes is not None and total > self.max_body_bytes:
+                # Drain the rest without storing it before responding
+                while more_body:
+                    more_body = (await receive()).get("more_body", False)
+                await self._send_blocked(send, self._oversized_result(total))
+                return
+            if not raw_body:
+                raw_body = chunk
+            elif chunk:
+                if isinstance(raw_body, bytes):
+                    raw_body = bytearray(raw_body)
+                raw_body += chunk
+            if not more_body:
                 break
 
-        raw_body = b"".join(body_parts)
+        # A body that is not a JSON object is validated as a whole, so a
+        # leading length check can reject it by size before any decoding.
+        if not _may_be_json_object(raw_body):
+            too_long = self._check_length_bytes(raw_body)
+            if too_long is not None:
+                await self._send_blocked(send, too_long)
+                return
 
-        # Try to extract text from JSON body
-        text_to_check = ""
-        try:
-            payload = json.loads(raw_body)
-            if isinstance(payload, dict):
-                # Check common text fields
-                for key in ("text", "message", "content", "prompt", "input", "query"):
-                    if key in payload and isinstance(payload[key], str):
-                        text_to_check = payload[key]
-                        break
-                if not text_to_check:
-                    text_to_check = raw_body.decode("utf-8", errors="replace")
-            else:
-                text_to_check = raw_body.decode("utf-8", errors="replace")
-        except (json.JSONDecodeError, UnicodeDecodeError):
+        payload, key, fast = self._parse_body(raw_body)
+        if key is not None:
+            text_to_check = payload[key]
+        else:
             text_to_check = raw_body.decode("utf-8", errors="replace")
 
         result = self.pipeline.run(text_to_check)
@@ -97,30 +209,82 @@ class ShelterMiddleware:
             await self._send_blocked(send, result)
             return
 
-        # If text was redacted, update the body
-        if result.action_taken == Action.REDACT and text_to_check != result.text:
-            try:
-                payload = json.loads(raw_body)
-                if isinstance(payload, dict):
-                    for key in ("text", "message", "content", "prompt", "input", "query"):
-                        if key in payload and isinstance(payload[key], str):
-                            payload[key] = result.text
-                            break
-                    raw_body = json.dumps(payload).encode("utf-8")
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
+        # If text was redacted, splice it into the already parsed payload
+        if (
+            key is not None
+            and result.action_taken == Action.REDACT
+            and text_to_check != result.text
+        ):
+            payload[key] = result.text
+            raw_body = _dumps(payload, fast)
+        elif isinstance(raw_body, bytearray):
+            raw_body = bytes(raw_body)  # ASGI requires the body as bytes
 
         # Forward with potentially modified body
-        body_sent = False
+        await self.app(scope, _OneShotReceive(raw_body), send)
 
-        async def modified_receive() -> dict[str, Any]:
-            nonlocal body_sent
-            if not body_sent:
-                body_sent = True
-                return {"type": "http.request", "body": raw_body, "more_body": False}
-            return {"type": "http.request", "body": b"", "more_body": False}
+    def _check_length_bytes(self, raw_body: bytes | bytearray) -> ValidationResult | None:
+        """Run a leading BLOCK :class:`LengthValidator` on the undecoded body.
 
-        await self.app(scope, modified_receive, send)
+        Only the first pipeline stage is consulted: it would be the first to
+        see the text, so blocking here gives the same outcome as the pipeline.
+        Audited pipelines are left to :meth:`GuardrailPipeline.run` so every
+        blocked request still produces an audit record.
+        """
+        validators = self.pipeline.validators
+        if not validators or self.pipeline.audit is not None:
+            return None
+        validator, action = validators[0]
+        if action != Action.BLOCK or not isinstance(validator, LengthValidator):
+            return None
+        result = validator.validate_bytes(raw_body)
+        if result is not None:
+            result.action_taken = Action.BLOCK
+        return result
+
+    def _oversized_result(self, received: int) -> ValidationResult:
+        """Build the blocked result reported for a body over ``max_body_bytes``."""
+        return ValidationResult(
+            is_valid=False,
+            text="",
+            original_text="",
+            findings=[
+                Finding(
+                    validator="middleware",
+                    category="max_body_bytes",
+                    description=(
+                        f"Request body exceeds limit of {self.max_body_bytes} bytes "
+                        f"({received}+ received)"
+                    ),
+                    severity=0.8,
+                )
+            ],
+            action_taken=Action.BLOCK,
+        )
+
+    @staticmethod
+    def _parse_body(raw_body: bytes | bytearray) -> tuple[Any, str | None, bool]:
+        """Parse *raw_body* once, returning the payload, its text field key
+        and whether orjson may re-serialize it (see :func:`_loads`).
+
+        The key is ``None`` when the body is not a JSON object or has no
+        non-empty string value under any of the common text keys; the whole
+        body is then validated, so an empty field cannot hide the rest.
+        Bodies that cannot contain a text key are not parsed at all, since
+        only the key path needs the payload.
+        """
+        if not _may_hold_text_key(raw_body):
+            return None, None, False
+        try:
+            payload, fast = _loads(raw_body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None, None, False
+        if isinstance(payload, dict):
+            for key in _TEXT_KEYS:
+                value = payload.get(key)
+                if isinstance(value, str) and value:
+                    return payload, key, fast
+        return payload, None, fast
 
     async def _send_blocked(self, send: Any, result: ValidationResult) -> None:
         """Send a 422 JSON response when the pipeline blocks a request."""
@@ -134,7 +298,7 @@ class ShelterMiddleware:
                 ],
             }
 
-        payload = json.dumps(body).encode("utf-8")
+        payload = _dumps(body)
         await send(
             {
                 "type": "http.response.start",
@@ -10,8 +10,12 @@ findings for ``WARN``.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -35,7 +39,7 @@ class Action(Enum):
     PASSTHROUGH = "passthrough"
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single finding from a validator.
 
@@ -56,7 +60,7 @@ class Finding:
     redacted_value: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result from running text through a validator or pipeline.
 
@@ -74,6 +78,14 @@ class ValidationResult:
     findings: list[Finding] = field(default_factory=list)
     action_taken: Action = Action.PASSTHROUGH
 
+    @classmethod
+    def clean(cls, text: str) -> ValidationResult:
+        """Build the passing result for *text*: unchanged, with no findings.
+
+        Validators use this on their no-findings fast paths.
+        """
+        return cls(is_valid=True, text=text, original_text=text)
+
     @property
     def blocked(self) -> bool:
         """Return ``True`` if the pipeline blocked this text."""
@@ -91,6 +103,11 @@ class Validator(Protocol):
 
     Any class with a ``name`` attribute and a ``validate(text) -> ValidationResult``
     method is a valid validator. No inheritance required.
+
+    Validators may also define an optional ``could_match(text) -> bool``
+    method: a cheap check (literal anchors, a length test) that returns
+    ``False`` only when ``validate`` would report no findings. The
+    pipeline uses it to skip all validation for clean text.
     """
 
     name: str
@@ -112,17 +129,36 @@ class GuardrailPipeline:
     decision as a JSONL compliance trail::
 
         pipeline = GuardrailPipeline(audit=AuditLogger("audit.jsonl"))
+
+    Set ``cache_size`` to reuse results for repeated inputs (retries,
+    shared chat templates). Validators with per-call side effects opt out
+    by setting ``cacheable = False`` (as
+    :class:`~llm_shelter.validators.ratelimit.RateLimitValidator` does),
+    which disables the cache for the whole pipeline.
     """
 
-    def __init__(self, audit: "AuditLogger | None" = None) -> None:
+    def __init__(self, audit: "AuditLogger | None" = None, cache_size: int = 0) -> None:
         """Create a pipeline, optionally attached to an audit log sink.
 
         Args:
             audit: When given, every :meth:`run` call appends one
                 :class:`~llm_shelter.auditlog.AuditRecord` to this logger.
+            cache_size: Maximum number of results to keep in an LRU cache
+                keyed on a hash of the input text. ``0`` (the default)
+                disables caching. The cache is cleared by :meth:`add`;
+                call :meth:`clear_cache` after reconfiguring a validator
+                in place.
         """
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
         self._validators: list[tuple[Validator, Action]] = []
         self.audit = audit
+        self.cache_size = cache_size
+        self._cacheable = True
+        self._cache: OrderedDict[bytes, tuple[ValidationResult, list[dict[str, Any]]]] = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
 
     @property
     def validators(self) -> list[tuple[Validator, Action]]:
@@ -144,15 +180,37 @@ class GuardrailPipeline:
             ``self``, allowing fluent chaining like ``pipeline.add(A).add(B)``.
         """
         self._validators.append((validator, action))
+        self._cacheable = self._cacheable and getattr(validator, "cacheable", True)
+        self.clear_cache()
         return self
 
+    def could_match(self, text: str) -> bool:
+        """Return ``False`` when no validator could report findings for *text*.
+
+        Asks each validator's optional ``could_match`` prefilter. Validators
+        without one are assumed to match, so a ``True`` answer only means
+        the full pipeline has to run.
+        """
+        for validator, _ in self._validators:
+            check = getattr(validator, "could_match", None)
+            if check is None or check(text):
+                return True
+        return False
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        with self._cache_lock:
+            self._cache.clear()
+
     def run(self, text: str, context: dict[str, Any] | None = None) -> ValidationResult:
         """Run text through all validators in sequence.
 
         Validators execute in the order they were added. On ``BLOCK``, the
         pipeline short-circuits immediately. On ``REDACT``, the modified text
         is forwarded to subsequent validators. On ``WARN``, the finding is
-        recorded but the text passes through unchanged.
+        recorded but the text passes through unchanged. When
+        :meth:`could_match` rules out every validator, the text passes
+        without running any of them.
 
         Args:
             text: The input text to validate.
@@ -165,54 +223,129 @@ class GuardrailPipeline:
             final action taken.
         """
         started = time.perf_counter()
-        original = text
-        all_findings: list[Finding] = []
-        final_action = Action.PASSTHROUGH
-        validator_runs: list[dict[str, Any]] = []
-
-        for validator, action in self._validators:
-            v_started = time.perf_counter()
-            result = validator.validate(text)
-            validator_runs.append(
-                {
-                    "name": validator.name,
-                    "action": action.value,
-                    "findings": len(result.findings),
-                    "latency_ms": round((time.perf_counter() - v_started) * 1000, 3),
-                }
-            )
+        key = self._cache_key(text)
+        cached = self._cache_lookup(key, started, context)
+        if cached is not None:
+            return cached
 
-            if result.has_findings:
-                all_findings.extend(result.findings)
-
-                if action == Action.BLOCK:
-                    blocked = ValidationResult(
-                        is_valid=False,
-                        text=text,
-                        original_text=original,
-                        findings=all_findings,
-                        action_taken=Action.BLOCK,
-                    )
-                    self._emit_audit(blocked, validator_runs, started, context)
-                    return blocked
-                elif action == Action.REDACT:
-                    text = result.text
-                    if final_action != Action.BLOCK:
-                        final_action = Action.REDACT
-                elif action == Action.WARN:
-                    if final_action == Action.PASSTHROUGH:
-                        final_action = Action.WARN
-
-        is_valid = final_action in (Action.PASSTHROUGH, Action.WARN)
-        final = ValidationResult(
-            is_valid=is_valid,
-            text=text,
-            original_text=original,
-            findings=all_findings,
-            action_taken=final_action,
-        )
-        self._emit_audit(final, validator_runs, started, context)
-        return final
+        state = _RunState(text)
+        if not self.could_match(text):
+            state.skip_all(self._validators)
+            return self._finish(state, key, started, context)
+
+        if self.audit is None:
+            # Nothing consumes per-validator timings, so skip collecting them
+            for validator, action in self._validators:
+                if state.apply(action, validator.validate(state.text)):
+                    break
+        else:
+            for validator, action in self._validators:
+                result, latency = _timed_validate(validator, state.text)
+                if state.record(validator, action, result, latency):
+                    break
+        return self._finish(state, key, started, context)
+
+    async def run_async(self, text: str, context: dict[str, Any] | None = None) -> ValidationResult:
+        """Run text through all validators without blocking the event loop.
+
+        Produces the same result as :meth:`run`, but validators execute in
+        the event loop's default executor. Consecutive ``WARN``/``BLOCK``
+        validators read the same text, so they run concurrently and total
+        latency approaches the slowest of them rather than the sum, which
+        pays off for I/O-bound validators (remote moderation APIs, model
+        servers). ``REDACT`` validators, and validators that set
+        ``concurrent_safe = False`` because they must not run when an
+        earlier validator blocks (such as
+        :class:`~llm_shelter.validators.ratelimit.RateLimitValidator`),
+        still run one at a time in order. Findings are folded in pipeline
+        order, so a ``BLOCK`` discards the results of later validators
+        exactly as :meth:`run` would never have run them.
+
+        Args:
+            text: The input text to validate.
+            context: Optional metadata attached to the audit record.
+
+        Returns:
+            A :class:`ValidationResult`, identical to what :meth:`run`
+            returns for the same input.
+        """
+        started = time.perf_counter()
+        key = self._cache_key(text)
+        cached = self._cache_lookup(key, started, context)
+        if cached is not None:
+            return cached
+
+        state = _RunState(text)
+        if not self.could_match(text):
+            state.skip_all(self._validators)
+            return self._finish(state, key, started, context)
+
+        loop = asyncio.get_running_loop()
+        validators = self._validators
+        i = 0
+        while i < len(validators) and not state.blocked:
+            j = i + 1
+            if _is_concurrent(*validators[i]):
+                while j < len(validators) and _is_concurrent(*validators[j]):
+                    j += 1
+            batch = validators[i:j]
+            futures = [
+                loop.run_in_executor(None, _timed_validate, validator, state.text)
+                for validator, _ in batch
+            ]
+            try:
+                for (validator, action), future in zip(batch, futures):
+                    result, latency = await future
+                    if state.record(validator, action, result, latency):
+                        break
+            finally:
+                for pending in futures:
+                    pending.cancel()
+                # Retrieve every outcome, so a failure in a discarded
+                # validator is not reported as never retrieved.
+                await asyncio.gather(*futures, return_exceptions=True)
+            i = j
+        return self._finish(state, key, started, context)
+
+    def _cache_key(self, text: str) -> bytes | None:
+        """Hash *text* for the result cache, or ``None`` when caching is off."""
+        if not self.cache_size or not self._cacheable:
+            return None
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _cache_lookup(
+        self, key: bytes | None, started: float, context: dict[str, Any] | None
+    ) -> ValidationResult | None:
+        """Return a copy of the cached result for *key*, auditing the hit."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+        if hit is None:
+            return None
+        cached, runs = hit
+        runs = [{**entry, "latency_ms": 0.0} for entry in runs]
+        self._emit_audit(cached, runs, started, context)
+        return _copy_result(cached)
+
+    def _finish(
+        self,
+        state: _RunState,
+        key: bytes | None,
+        started: float,
+        context: dict[str, Any] | None,
+    ) -> ValidationResult:
+        """Build the final result from *state*, audit it, and cache it."""
+        result = state.result()
+        self._emit_audit(result, state.runs, started, context)
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = (_copy_result(result), state.runs)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
 
     def _emit_audit(
         self,
@@ -233,3 +366,80 @@ class GuardrailPipeline:
             context=context,
         )
         self.audit.log(record)
+
+
+def _copy_result(result: ValidationResult) -> ValidationResult:
+    """Copy *result* and its findings so cached entries cannot be mutated by callers."""
+    return replace(result, findings=[replace(f) for f in result.findings])
+
+
+class _RunState:
+    """Fold per-validator results into a pipeline result, in pipeline order."""
+
+    def __init__(self, text: str) -> None:
+        self.original = text
+        self.text = text
+        self.findings: list[Finding] = []
+        self.final_action = Action.PASSTHROUGH
+        self.blocked = False
+        self.runs: list[dict[str, Any]] = []
+
+    def record(
+        self, validator: Validator, action: Action, result: ValidationResult, latency: float
+    ) -> bool:
+        """Log and apply one validator's *result*. Returns ``True`` when the pipeline blocks."""
+        self.runs.append(
+            {
+                "name": validator.name,
+                "action": action.value,
+                "findings": len(result.findings),
+                "latency_ms": round(latency * 1000, 3),
+            }
+        )
+        return self.apply(action, result)
+
+    def apply(self, action: Action, result: ValidationResult) -> bool:
+        """Apply one validator's *result*. Returns ``True`` when the pipeline blocks."""
+        findings = result.findings
+        if not findings:
+            return False
+        self.findings.extend(findings)
+
+        # Enum members are singletons, so identity checks skip Enum.__eq__
+        if action is Action.BLOCK:
+            self.final_action = Action.BLOCK
+            self.blocked = True
+        elif action is Action.REDACT:
+            self.text = result.text
+            self.final_action = Action.REDACT
+        elif action is Action.WARN and self.final_action is Action.PASSTHROUGH:
+            self.final_action = Action.WARN
+        return self.blocked
+
+    def skip_all(self, validators: list[tuple[Validator, Action]]) -> None:
+        """Record *validators* as clean runs after the prefilter ruled them out."""
+        for validator, action in validators:
+            self.runs.append(
+                {"name": validator.name, "action": action.value, "findings": 0, "latency_ms": 0.0}
+            )
+
+    def result(self) -> ValidationResult:
+        return ValidationResult(
+            is_valid=self.final_action in (Action.PASSTHROUGH, Action.WARN),
+            text=self.text,
+            original_text=self.original,
+            findings=self.findings,
+            action_taken=self.final_action,
+        )
+
+
+def _timed_validate(validator: Validator, text: str) -> tuple[ValidationResult, float]:
+    """Run *validator* on *text*, returning its result and elapsed seconds."""
+    started = time.perf_counter()
+    result = validator.validate(text)
+    return result, time.perf_counter() - started
+
+
+def _is_concurrent(validator: Validator, action: Action) -> bool:
+    """Whether *validator* only reads the text and may run alongside its neighbours."""
+    return action != Action.REDACT and getattr(validator, "concurrent_safe", True)
@@ -0,0 +1,220 @@
+"""Multi-pattern prefilter and span helpers shared by the regex-based validators.
+
+Private to the validators package: PII, toxicity, injection, secrets and
+custom regex validators import these helpers, but they are not part of
+the public API and may change without notice.
+
+When the optional ``hyperscan`` package is installed (``pip install
+llm-shelter[hyperscan]``), :func:`possible_matches` uses it to rule out
+patterns in a single pass. Without it, the stdlib :func:`combine_patterns`
+alternation gives the same results.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any
+
+try:
+    import hyperscan
+
+    _HAVE_HYPERSCAN = True
+except ImportError:  # pragma: no cover - exercised when hyperscan is absent
+    _HAVE_HYPERSCAN = False
+
+from llm_shelter.pipeline import Finding
+
+_LEADING_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_NUMBERED_BACKREF = re.compile(r"\\[1-9]")
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.ASCII, "a"))
+
+
+@lru_cache(maxsize=64)
+def combine_patterns(patterns: tuple[re.Pattern[str], ...]) -> re.Pattern[str] | None:
+    """Union *patterns* into one alternation so clean text is scanned once.
+
+    Regex-based validators use the result as a gate: if the combined
+    pattern finds nothing, none of the individual patterns can match and
+    the per-pattern scans are skipped. Each pattern's flags are moved
+    into a scoped ``(?flags:...)`` group, since global inline flags are
+    only legal at the start of a regex.
+
+    Args:
+        patterns: Compiled patterns to combine. Must be a tuple so the
+            result can be cached.
+
+    Returns:
+        The combined pattern, or ``None`` when the patterns cannot be
+        combined safely (verbose mode, numbered backreferences, or
+        clashing group names), in which case callers scan pattern by
+        pattern.
+    """
+    parts: list[str] = []
+    for pattern in patterns:
+        source = _LEADING_FLAGS.sub("", pattern.pattern, count=1)
+        if pattern.flags & re.VERBOSE or _NUMBERED_BACKREF.search(source):
+            return None
+        letters = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+        parts.append(f"(?{letters}:{source})" if letters else f"(?:{source})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+# Hyperscan sees bytes with PCRE semantics, which agree with ``re`` on
+# ASCII text except that ``re``'s ``\s`` also matches \x1c-\x1f. Any
+# text containing these characters is not prefiltered.
+_HYPERSCAN_UNSAFE = re.compile(r"[^\x00-\x1b\x20-\x7f]")
+
+
+@lru_cache(maxsize=64)
+def _hyperscan_database(patterns: tuple[re.Pattern[str], ...]) -> tuple[Any, frozenset[int]] | None:
+    """Compile *patterns* into a Hyperscan prefilter database.
+
+    Patterns are compiled in prefilter mode, which may over-report but
+    never misses a match, so lookarounds and backreferences are accepted.
+    Patterns Hyperscan cannot take at all (verbose mode, non-ASCII source,
+    ``re``-only syntax such as ``{,n}``) are left out and returned as the
+    indices that must always be scanned.
+    """
+    expressions: list[bytes] = []
+    ids: list[int] = []
+    flags: list[int] = []
+    base = (
+        hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+    )
+    for index, pattern in enumerate(patterns):
+        source = _LEADING_FLAGS.sub("", pattern.pattern, count=1)
+        if pattern.flags & re.VERBOSE or not source.isascii() or "{," in source:
+            continue
+        pattern_flags = base
+        if pattern.flags & re.IGNORECASE:
+            pattern_flags |= hyperscan.HS_FLAG_CASELESS
+        if pattern.flags & re.MULTILINE:
+            pattern_flags |= hyperscan.HS_FLAG_MULTILINE
+        if pattern.flags & re.DOTALL:
+            pattern_flags |= hyperscan.HS_FLAG_DOTALL
+        try:
+            hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK).compile(
+                expressions=[source.encode()], ids=[index], elements=1, flags=[pattern_flags]
+            )
+        except hyperscan.error:
+            continue
+        expressions.append(source.encode())
+        ids.append(index)
+        flags.append(pattern_flags)
+    if not expressions:
+        return None
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(expressions=expressions, ids=ids, elements=len(ids), flags=flags)
+    return database, frozenset(range(len(patterns))) - frozenset(ids)
+
+
+def possible_matches(patterns: tuple[re.Pattern[str], ...], text: str) -> Sequence[int]:
+    """Return the indices of *patterns* that may match *text*, in order.
+
+    Patterns left out can be skipped, since they are guaranteed not to
+    match. With Hyperscan installed, ASCII text is checked against every
+    pattern in one pass; otherwise (or for other text) the
+    :func:`combine_patterns` alternation rules out all or none of them.
+
+    Args:
+        patterns: Compiled patterns to check. Must be a tuple so the
+            compiled prefilter can be cached.
+        text: The text the patterns will be run against.
+
+    Returns:
+        A sequence of indices into *patterns*.
+    """
+    if _HAVE_HYPERSCAN and _HYPERSCAN_UNSAFE.search(text) is None:
+        compiled = _hyperscan_database(patterns)
+        if compiled is not None:
+            database, unscanned = compiled
+            hits = set(unscanned)
+            try:
+                database.scan(text.encode("ascii"), match_event_handler=lambda i, *_: hits.add(i))
+            except hyperscan.error:
+                pass  # e.g. scratch space busy in another thread: fall back
+            else:
+                return sorted(hits)
+    combined = combine_patterns(patterns)
+    if combined is not None and combined.search(text) is None:
+        return ()
+    return range(len(patterns))
+
+
+def merge_overlaps(findings: list[Finding]) -> list[Finding]:
+    """Collapse overlapping findings into one finding per overlap group.
+
+    The finding with the highest severity in each group is kept (the one
+    that starts first, on a tie), with its span widened to the whole group
+    so that redacting it still hides every overlapping match. Findings with
+    a span come back in text order, followed by any without one.
+
+    Args:
+        findings: Findings in any order.
+
+    Returns:
+        A new list with no two spans overlapping.
+    """
+    merged: list[Finding] = []
+    best: Finding | None = None
+    group_start = group_end = 0
+    for start, neg_end, i in sorted(
+        (f.span[0], -f.span[1], i) for i, f in enumerate(findings) if f.span
+    ):
+        finding = findings[i]
+        end = -neg_end
+        if best is not None and start < group_end:
+            group_end = max(group_end, end)
+            if finding.severity > best.severity:
+                best = finding
+            continue
+        if best is not None:
+            merged.append(_widened(best, group_start, group_end))
+        best, group_start, group_end = finding, start, end
+    if best is not None:
+        merged.append(_widened(best, group_start, group_end))
+    merged.extend(f for f in findings if not f.span)
+    return merged
+
+
+def _widened(finding: Finding, start: int, end: int) -> Finding:
+    """Return *finding* with its span set to ``(start, end)``, copying only if it changes."""
+    return finding if finding.span == (start, end) else replace(finding, span=(start, end))
+
+
+def redact_spans(text: str, findings: list[Finding]) -> str:
+    """Replace each finding's span in *text* with its ``redacted_value``.
+
+    Builds the result in one left-to-right pass rather than re-slicing the
+    whole string per finding. Overlapping spans are redacted as their
+    union, under the placeholder of the finding that starts first (the
+    longest, on a tie), so no part of any match survives. Findings without
+    a span or a ``redacted_value`` are ignored.
+
+    Args:
+        text: The text the findings' spans refer to.
+        findings: Findings in any order.
+
+    Returns:
+        The redacted text.
+    """
+    spans = sorted(
+        (f.span[0], -f.span[1], f.redacted_value) for f in findings if f.span and f.redacted_value
+    )
+    parts: list[str] = []
+    cursor = 0
+    for start, neg_end, placeholder in spans:
+        if start < cursor:
+            cursor = max(cursor, -neg_end)
+            continue
+        parts.append(text[cursor:start])
+        parts.append(placeholder)
+        cursor = -neg_end
+    parts.append(text[cursor:])
+    return "".join(parts)
@@ -11,6 +11,7 @@ import re
 from dataclasses import dataclass
 
 from llm_shelter.pipeline import Action, Finding, ValidationResult
+from llm_shelter.validators._prefilter import possible_matches
 
 
 @dataclass
@@ -21,11 +22,15 @@ class InjectionPattern:
         name: Short identifier (e.g. ``"instruction_override"``).
         pattern: Compiled regex to match against input text.
         severity: Score from 0.0 to 1.0 indicating how dangerous the pattern is.
+        anchors: Lowercase literals, at least one of which must appear in any
+            text the pattern can match. Used to skip the regex on text that
+            contains none of them. Empty means the pattern always runs.
     """
 
     name: str
     pattern: re.Pattern[str]
     severity: float = 1.0
+    anchors: tuple[str, ...] = ()
 
 
 # Instruction override patterns
@@ -33,27 +38,40 @@ _OVERRIDE_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         "instruction_override",
         re.compile(
-            r"(?i)\b(?:ignore|disregard|forget|override|bypass)\b.{0,30}"
+            r"\b(?:ignore|disregard|forget|override|bypass)\b.{0,30}"
             r"(?:previous|above|prior|all|earlier|system)\b.{0,30}"
-            r"(?:instructions?|rules?|prompts?|guidelines?|constraints?)\b"
+            r"(?:instructions?|rules?|prompts?|guidelines?|constraints?)\b",
+            re.IGNORECASE,
         ),
         severity=0.95,
+        anchors=("ignore", "disregard", "forget", "override", "bypass"),
     ),
     InjectionPattern(
         "new_instruction",
         re.compile(
-            r"(?i)\b(?:you are now|from now on|new instructions?|your (?:new |real )"
-            r"(?:role|instructions?|purpose|objective)|act as if)\b"
+            r"\b(?:you are now|from now on|new instructions?|your (?:new |real )"
+            r"(?:role|instructions?|purpose|objective)|act as if)\b",
+            re.IGNORECASE,
         ),
         severity=0.9,
+        anchors=(
+            "you are now",
+            "from now on",
+            "new instruction",
+            "your new ",
+            "your real ",
+            "act as if",
+        ),
     ),
     InjectionPattern(
         "system_prompt_extraction",
         re.compile(
-            r"(?i)(?:reveal|show|print|output|display|repeat|echo|dump|leak)"
-            r".{0,20}(?:system\s*prompt|initial\s*prompt|instructions?|hidden|secret)"
+            r"(?:reveal|show|print|output|display|repeat|echo|dump|leak)"
+            r".{0,20}(?:system\s*prompt|initial\s*prompt|instructions?|hidden|secret)",
+            re.IGNORECASE,
         ),
         severity=0.9,
+        anchors=("reveal", "show", "print", "output", "display", "repeat", "echo", "dump", "leak"),
     ),
 ]
 
@@ -66,11 +84,17 @@ _DELIMITER_PATTERNS: list[InjectionPattern] = [
             r"\[INST\]|\[/INST\]|<<SYS>>|<</SYS>>|###\s*(?:System|Human|Assistant):)"
         ),
         severity=0.95,
+        anchors=("```", "<|", "system>", "inst]", "sys>>", "###"),
     ),
     InjectionPattern(
         "role_switch",
-        re.compile(r"(?i)(?:^|\n)\s*(?:system|assistant|human|user)\s*:\s*\S"),
+        # Only horizontal whitespace may precede the role: letting ``\s*`` span
+        # newlines made runs of blank lines quadratic to scan.
+        re.compile(
+            r"^[^\S\n]*(?:system|assistant|human|user)\s*:\s*\S", re.IGNORECASE | re.MULTILINE
+        ),
         severity=0.7,
+        anchors=(":",),
     ),
 ]
 
@@ -79,20 +103,26 @@ _ENCODING_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         "base64_payload",
         re.compile(
-            r"(?i)(?:decode|base64|eval|execute)\s*[\(:]?\s*['\"]?"
-            r"[A-Za-z0-9+/]{20,}={0,2}"
+            r"(?:decode|base64|eval|execute)\s*[\(:]?\s*['\"]?"
+            r"[A-Za-z0-9+/]{20,}={0,2}",
+            re.IGNORECASE,
         ),
         severity=0.85,
+        anchors=("decode", "base64", "eval", "execute"),
     ),
     InjectionPattern(
         "unicode_smuggling",
         re.compile(r"[\u200b\u200c\u200d\u2060\ufeff]{3,}"),
         severity=0.8,
+        anchors=("\u200b", "\u200c", "\u200d", "\u2060", "\ufeff"),
     ),
     InjectionPattern(
         "hex_encoded",
-        re.compile(r"(?i)(?:\\x[0-9a-f]{2}){4,}"),
+        # Nothing here folds differently under Unicode rules, so ASCII-only
+        # matching is exact and lets ``re`` skip the Unicode case tables.
+        re.compile(r"(?:\\x[0-9a-f]{2}){4,}", re.IGNORECASE | re.ASCII),
         severity=0.7,
+        anchors=("\\x",),
     ),
 ]
 
@@ -109,6 +139,10 @@ class InjectionValidator:
     """
 
     name: str = "injection"
+    # Candidates found by the last could_match call, handed over to the
+    # validate call that usually follows for the same text object so the
+    # anchor scan runs once per pipeline run.
+    _prefiltered: tuple[str, list[InjectionPattern]] | None = None
 
     def __init__(
         self,
@@ -120,6 +154,67 @@ class InjectionValidator:
         self.threshold = threshold
         self.action = action
 
+    def _candidates(self, text: str) -> list[InjectionPattern]:
+        """Return the patterns that could match *text*, judged by threshold and anchors."""
+        # Anchors are only a safe prefilter for ASCII text: with IGNORECASE,
+        # ``re`` also folds a few non-ASCII letters (e.g. the long s) onto
+        # ASCII ones, which ``str.lower`` does not.
+        lowered = text.lower() if text.isascii() else None
+
+        # Patterns below the threshold can never produce a finding, so
+        # skip scanning them instead of discarding their matches.
+        return [
+            inj
+            for inj in self.patterns
+            if inj.severity >= self.threshold
+            and (
+                lowered is None
+                or not inj.anchors
+                or any(anchor in lowered for anchor in inj.anchors)
+            )
+        ]
+
+    def could_match(self, text: str) -> bool:
+        """Cheaply check whether :meth:`validate` could report anything for *text*.
+
+        Only literal anchors are consulted, so ``True`` does not guarantee
+        a finding, but ``False`` guarantees there is none.
+        """
+        candidates = self._candidates(text)
+        if candidates:
+            self._prefiltered = (text, candidates)
+        return bool(candidates)
+
+    def _take_candidates(self, text: str) -> list[InjectionPattern]:
+        """Return the candidates for *text*, reusing those :meth:`could_match` found."""
+        handoff, self._prefiltered = self._prefiltered, None
+        if handoff is not None and handoff[0] is text:
+            return handoff[1]
+        return self._candidates(text)
+
+    def _active(self, text: str) -> list[InjectionPattern]:
+        """Return the patterns left after the anchor and multi-pattern prefilters."""
+        active = self._take_candidates(text)
+
+        # Most text is clean: a single multi-pattern pass rules out the
+        # patterns that cannot match. Only those left rescan on their own,
+        # which keeps overlapping matches from different patterns. The
+        # prefilter covers all patterns, not just the candidates, so it is
+        # compiled once per pattern list.
+        if active:
+            patterns = tuple(inj.pattern for inj in self.patterns)
+            may_match = {patterns[i] for i in possible_matches(patterns, text)}
+            active = [inj for inj in active if inj.pattern in may_match]
+        return active
+
+    def fast_check(self, text: str) -> bool:
+        """Return whether *text* contains an injection, stopping at the first match.
+
+        Answers the same question as ``not validate(text).is_valid`` without
+        collecting findings, for callers that only need a yes or no.
+        """
+        return any(inj.pattern.search(text) for inj in self._active(text))
+
     def validate(self, text: str) -> ValidationResult:
         """Scan *text* for prompt injection patterns.
 
@@ -131,21 +226,31 @@ class InjectionValidator:
             :class:`~llm_shelter.pipeline.Finding` per matched pattern
             whose severity meets the threshold.
         """
+        active = self._active(text)
+        if not active:
+            return ValidationResult.clean(text)
+
         findings: list[Finding] = []
 
-        for inj in self.patterns:
+        # Per-pattern values are resolved once, outside the per-match loop
+        validator = self.name
+        append = findings.append
+        for inj in active:
+            category = inj.name
+            severity = inj.severity
+            prefix = f"Potential injection ({category}): '"
             for match in inj.pattern.finditer(text):
-                if inj.severity >= self.threshold:
-                    findings.append(
-                        Finding(
-                            validator=self.name,
-                            category=inj.name,
-                            description=f"Potential injection ({inj.name}): "
-                            f"'{match.group()[:50]}...'",
-                            span=(match.start(), match.end()),
-                            severity=inj.severity,
-                        )
+                # One span() call, and only the quoted snippet is ever copied
+                start, end = span = match.span()
+                append(
+                    Finding(
+                        validator=validator,
+                        category=category,
+                        description=prefix + text[start : min(end, start + 50)] + "...'",
+                        span=span,
+                        severity=severity,
                     )
+                )
 
         return ValidationResult(
             is_valid=len(findings) == 0,
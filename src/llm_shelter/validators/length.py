@@ -51,6 +51,51 @@ class LengthValidator:
         """
         return max(1, int(len(text) / 4))
 
+    def could_match(self, text: str) -> bool:
+        """Return ``True`` when *text* may exceed a configured limit.
+
+        Only the O(1) character check is made here. A token limit always
+        answers ``True``, so an overridden :meth:`estimate_tokens` (e.g. a
+        real tokeniser) runs once, in :meth:`validate`, not twice.
+        """
+        if self.max_chars is not None and len(text) > self.max_chars:
+            return True
+        return self.max_tokens is not None
+
+    def validate_bytes(self, raw: bytes | bytearray) -> ValidationResult | None:
+        """Check UTF-8 encoded input against ``max_chars`` without decoding it.
+
+        A UTF-8 character takes at most 4 bytes (and a decode with
+        ``errors="replace"`` never yields fewer characters), so input longer
+        than ``4 * max_chars`` bytes is over the limit whatever it decodes to.
+
+        Args:
+            raw: UTF-8 encoded input.
+
+        Returns:
+            A failing :class:`~llm_shelter.pipeline.ValidationResult` when the
+            byte length alone proves the character limit is exceeded, or
+            ``None`` when the text has to be decoded to decide.
+        """
+        if self.max_chars is None or len(raw) <= self.max_chars * 4:
+            return None
+        return ValidationResult(
+            is_valid=False,
+            text="",
+            original_text="",
+            findings=[
+                Finding(
+                    validator=self.name,
+                    category="max_chars",
+                    description=(
+                        f"Body of {len(raw)} bytes exceeds limit of {self.max_chars} chars"
+                    ),
+                    severity=0.8,
+                )
+            ],
+            action_taken=self.action,
+        )
+
     def validate(self, text: str) -> ValidationResult:
         """Check whether *text* exceeds configured length limits.
 
@@ -61,9 +106,16 @@ class LengthValidator:
             A :class:`~llm_shelter.pipeline.ValidationResult` with findings
             for each exceeded limit.
         """
+        # estimate_tokens may be an expensive tokeniser, so call it once
+        over_chars = self.max_chars is not None and len(text) > self.max_chars
+        est = self.estimate_tokens(text) if self.max_tokens is not None else 0
+        over_tokens = self.max_tokens is not None and est > self.max_tokens
+        if not (over_chars or over_tokens):
+            return ValidationResult.clean(text)
+
         findings: list[Finding] = []
 
-        if self.max_chars is not None and len(text) > self.max_chars:
+        if over_chars:
             findings.append(
                 Finding(
                     validator=self.name,
@@ -73,17 +125,15 @@ class LengthValidator:
                 )
             )
 
-        if self.max_tokens is not None:
-            est = self.estimate_tokens(text)
-            if est > self.max_tokens:
-                findings.append(
-                    Finding(
-                        validator=self.name,
-                        category="max_tokens",
-                        description=f"Estimated {est} tokens exceeds limit of {self.max_tokens}",
-                        severity=0.8,
-                    )
+        if over_tokens:
+            findings.append(
+                Finding(
+                    validator=self.name,
+                    category="max_tokens",
+                    description=f"Estimated {est} tokens exceeds limit of {self.max_tokens}",
+                    severity=0.8,
                 )
+            )
 
         return ValidationResult(
             is_valid=len(findings) == 0,
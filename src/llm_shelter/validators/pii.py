@@ -8,28 +8,82 @@ is regex-based.
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 
 from llm_shelter.pipeline import Action, Finding, ValidationResult
+from llm_shelter.validators._prefilter import merge_overlaps, possible_matches, redact_spans
 
 
-@dataclass
+@dataclass(slots=True)
 class PIIPattern:
-    """A named regex pattern for PII detection."""
+    """A named regex pattern for PII detection.
+
+    ``anchors`` lists case-sensitive literals, at least one of which must
+    appear in any text the pattern can match. Text containing none of
+    them skips the regex. Empty means the pattern always runs.
+
+    ``check``, when set, is called with each match and must return
+    ``True`` for the match to count. It lets the regex stay simple while
+    rules that are awkward to express as a pattern run in Python.
+    """
 
     name: str
     pattern: re.Pattern[str]
     placeholder: str
     severity: float = 1.0
+    anchors: tuple[str, ...] = ()
+    check: Callable[[re.Match[str]], bool] | None = None
+
+
+_DIGITS = tuple("0123456789")
+
+_PATTERN_OF = attrgetter("pattern")
+
+# Luhn doubles every second digit from the right, then sums the digits of the result
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+@lru_cache(maxsize=256)
+def _description_prefix(name: str) -> str:
+    """Return the shared, interned finding description prefix for pattern *name*."""
+    return sys.intern(f"Detected {name}: ")
+
+
+def _valid_ssn(match: re.Match[str]) -> bool:
+    """Reject SSNs with area 000, 666 or 900-999, group 00 or serial 0000."""
+    area, group, serial = match.groups()
+    area_number = int(area)
+    return (
+        area_number != 0
+        and area_number != 666
+        and area_number < 900
+        and int(group) != 0
+        and int(serial) != 0
+    )
+
+
+def _valid_luhn(match: re.Match[str]) -> bool:
+    """Return whether the matched card number has a valid Luhn checksum."""
+    digits = [int(c) for c in match.group() if c.isdecimal()]
+    total = sum(digits[-1::-2]) + sum(_LUHN_DOUBLED[d] for d in digits[-2::-2])
+    return total % 10 == 0
 
 
 # --- Patterns ---
 
 _EMAIL = PIIPattern(
     name="email",
-    pattern=re.compile(r"\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b"),
+    # The local part starts where a run of local-part characters starts. A
+    # ``\b`` start let every word boundary inside a long run like
+    # ``a.a.a.a`` rescan the rest of it, which was quadratic.
+    pattern=re.compile(r"(?<![A-Za-z0-9._%+\-])[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b"),
     placeholder="[EMAIL_REDACTED]",
     severity=0.8,
+    anchors=("@",),
 )
 
 _PHONE_US = PIIPattern(
@@ -43,13 +97,18 @@ _PHONE_US = PIIPattern(
     ),
     placeholder="[PHONE_REDACTED]",
     severity=0.8,
+    anchors=_DIGITS,
 )
 
 _SSN = PIIPattern(
     name="ssn",
-    pattern=re.compile(r"\b(?!000|666|9\d{2})\d{3}[\s\-](?!00)\d{2}[\s\-](?!0000)\d{4}\b"),
+    # Lookaheads for the reserved ranges made every digit run backtrack;
+    # the number ranges are checked on the captured groups instead.
+    pattern=re.compile(r"\b(\d{3})[\s\-](\d{2})[\s\-](\d{4})\b"),
     placeholder="[SSN_REDACTED]",
     severity=1.0,
+    anchors=_DIGITS,
+    check=_valid_ssn,
 )
 
 _CREDIT_CARD = PIIPattern(
@@ -62,6 +121,8 @@ _CREDIT_CARD = PIIPattern(
     ),
     placeholder="[CREDIT_CARD_REDACTED]",
     severity=1.0,
+    anchors=_DIGITS,
+    check=_valid_luhn,
 )
 
 _IP_ADDRESS = PIIPattern(
@@ -71,6 +132,7 @@ _IP_ADDRESS = PIIPattern(
     ),
     placeholder="[IP_REDACTED]",
     severity=0.5,
+    anchors=_DIGITS,
 )
 
 _AWS_KEY = PIIPattern(
@@ -78,9 +140,18 @@ _AWS_KEY = PIIPattern(
     pattern=re.compile(r"\b(?:AKIA|ABIA|ACCA|ASIA)[0-9A-Z]{16}\b"),
     placeholder="[AWS_KEY_REDACTED]",
     severity=1.0,
+    anchors=("AKIA", "ABIA", "ACCA", "ASIA"),
 )
 
-DEFAULT_PATTERNS: list[PIIPattern] = [_EMAIL, _PHONE_US, _SSN, _CREDIT_CARD, _IP_ADDRESS, _AWS_KEY]
+# A tuple so the shared defaults cannot be mutated through a validator
+DEFAULT_PATTERNS: tuple[PIIPattern, ...] = (
+    _EMAIL,
+    _PHONE_US,
+    _SSN,
+    _CREDIT_CARD,
+    _IP_ADDRESS,
+    _AWS_KEY,
+)
 
 
 class PIIValidator:
@@ -93,6 +164,10 @@ class PIIValidator:
     """
 
     name: str = "pii"
+    # Candidates found by the last could_match call, handed over to the
+    # validate call that usually follows for the same text object so the
+    # anchor scan runs once per pipeline run.
+    _prefiltered: tuple[str, list[PIIPattern]] | None = None
 
     def __init__(
         self,
@@ -100,10 +175,106 @@ class PIIValidator:
         redact: bool = True,
         action: Action = Action.REDACT,
     ) -> None:
-        self.patterns = patterns or list(DEFAULT_PATTERNS)
+        # The shared defaults are copied only if the list is asked for
+        self._patterns: list[PIIPattern] | tuple[PIIPattern, ...] = patterns or DEFAULT_PATTERNS
         self.redact = redact
         self.action = action
 
+    @property
+    def patterns(self) -> list[PIIPattern]:
+        """The patterns this validator checks, as a list callers may modify."""
+        if isinstance(self._patterns, tuple):
+            self._patterns = list(self._patterns)
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, patterns: list[PIIPattern]) -> None:
+        self._patterns = patterns
+
+    def _candidates(self, text: str) -> list[PIIPattern]:
+        """Return the patterns whose anchors appear in *text*."""
+        # ``\d`` also matches non-ASCII digits, so anchors only rule
+        # patterns out for ASCII text.
+        if not text.isascii():
+            return list(self._patterns)
+        # Each ``in`` is a C-level memchr/fastsearch pass. Patterns sharing an
+        # anchor tuple (the digit patterns) are resolved once, stopping at the
+        # first anchor found. A plain loop is used rather than ``any()`` with
+        # a generator, which roughly doubled the cost of this method.
+        found: dict[tuple[str, ...], bool] = {}
+        candidates: list[PIIPattern] = []
+        for pii in self._patterns:
+            anchors = pii.anchors
+            if anchors:
+                hit = found.get(anchors)
+                if hit is None:
+                    for anchor in anchors:
+                        if anchor in text:
+                            hit = True
+                            break
+                    else:
+                        hit = False
+                    found[anchors] = hit
+                if not hit:
+                    continue
+            candidates.append(pii)
+        return candidates
+
+    def could_match(self, text: str) -> bool:
+        """Cheaply check whether :meth:`validate` could report anything for *text*.
+
+        ``False`` guarantees no findings; ``True`` only means a regex has
+        to run.
+        """
+        candidates = self._candidates(text)
+        if candidates:
+            self._prefiltered = (text, candidates)
+        return bool(candidates)
+
+    def _take_candidates(self, text: str) -> list[PIIPattern]:
+        """Return the candidates for *text*, reusing those :meth:`could_match` found."""
+        handoff, self._prefiltered = self._prefiltered, None
+        if handoff is not None and handoff[0] is text:
+            return handoff[1]
+        return self._candidates(text)
+
+    def _active(self, text: str) -> list[PIIPattern]:
+        """Return the patterns left after the anchor and multi-pattern prefilters."""
+        candidates = self._take_candidates(text)
+
+        # One multi-pattern pass rules out patterns that cannot match. The
+        # rest rescan on their own, so overlapping matches from different
+        # patterns are all still reported. The prefilter is built over all
+        # patterns rather than the candidates, so it is compiled once per
+        # pattern list instead of once per anchor combination.
+        if candidates:
+            patterns = tuple(map(_PATTERN_OF, self._patterns))
+            hits = possible_matches(patterns, text)
+            # The stdlib gate rules out all patterns or none; only a partial
+            # answer (from Hyperscan) needs filtering pattern by pattern.
+            if not hits:
+                return []
+            if len(hits) < len(patterns):
+                may_match = {patterns[i] for i in hits}
+                candidates = [pii for pii in candidates if pii.pattern in may_match]
+        return candidates
+
+    def fast_check(self, text: str) -> bool:
+        """Return whether *text* contains any PII, stopping at the first match.
+
+        Answers the same question as ``not validate(text).is_valid`` without
+        collecting findings or redacting, for callers that only need a yes
+        or no.
+        """
+        for pii in self._active(text):
+            check = pii.check
+            if check is None:
+                if pii.pattern.search(text):
+                    return True
+            elif any(map(check, pii.pattern.finditer(text))):
+                return True
+        return False
+
     def validate(self, text: str) -> ValidationResult:
         """Scan *text* for PII and optionally redact matches.
 
@@ -114,30 +285,45 @@ class PIIValidator:
             A :class:`~llm_shelter.pipeline.ValidationResult`. When ``redact``
             is enabled, ``result.text`` contains the redacted version.
         """
+        candidates = self._active(text)
+        if not candidates:
+            return ValidationResult.clean(text)
+
         findings: list[Finding] = []
         redacted = text
 
-        for pii in self.patterns:
+        # Per-pattern fields are unpacked once, outside the per-match loop
+        validator = self.name
+        append = findings.append
+        for pii in candidates:
+            category = pii.name
+            placeholder = pii.placeholder
+            severity = pii.severity
+            prefix = _description_prefix(category)
+            check = pii.check
             for match in pii.pattern.finditer(text):
-                findings.append(
+                if check is not None and not check(match):
+                    continue
+                start, end = span = match.span()
+                append(
                     Finding(
-                        validator=self.name,
-                        category=pii.name,
-                        description=f"Detected {pii.name}: {match.group()[:4]}***",
-                        span=(match.start(), match.end()),
-                        severity=pii.severity,
-                        redacted_value=pii.placeholder,
+                        validator=validator,
+                        category=category,
+                        # One BUILD_STRING rather than two concatenations
+                        description=f"{prefix}{text[start : min(end, start + 4)]}***",
+                        span=span,
+                        severity=severity,
+                        redacted_value=placeholder,
                     )
                 )
 
+        # Overlapping matches (an IP inside an email address) are reported
+        # once, by the most severe pattern, before any redaction happens
+        if len(findings) > 1:
+            findings = merge_overlaps(findings)
+
         if self.redact and findings:
-            # Redact from right to left to preserve span positions
-            sorted_findings = sorted(
-                findings, key=lambda f: f.span[0] if f.span else 0, reverse=True
-            )
-            for f in sorted_findings:
-                if f.span and f.redacted_value:
-                    redacted = redacted[: f.span[0]] + f.redacted_value + redacted[f.span[1] :]
+            redacted = redact_spans(text, findings)
 
         return ValidationResult(
             is_valid=len(findings) == 0,
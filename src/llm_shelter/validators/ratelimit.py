@@ -127,6 +127,11 @@ class RateLimitValidator:
     """
 
     name: str = "rate_limit"
+    # Every call consumes a slot, so results must never be served from a cache.
+    cacheable: bool = False
+    # A slot must not be consumed when an earlier validator blocks, so
+    # run_async keeps this validator in pipeline order.
+    concurrent_safe: bool = False
 
     def __init__(
         self,
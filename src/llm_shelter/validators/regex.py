@@ -13,6 +13,7 @@ import re
 from dataclasses import dataclass
 
 from llm_shelter.pipeline import Action, Finding, ValidationResult
+from llm_shelter.validators._prefilter import combine_patterns, redact_spans
 
 
 @dataclass
@@ -166,6 +167,10 @@ class RegexValidator:
             ``redact`` is enabled, ``result.text`` has matches replaced
             with each pattern's placeholder.
         """
+        combined = combine_patterns(tuple(rule.pattern for rule in self.patterns))
+        if combined is not None and combined.search(text) is None:
+            return ValidationResult.clean(text)
+
         findings: list[Finding] = []
         redacted = text
 
@@ -186,13 +191,7 @@ class RegexValidator:
                 )
 
         if self.redact and findings:
-            # Redact from right to left to preserve span positions
-            sorted_findings = sorted(
-                findings, key=lambda f: f.span[0] if f.span else 0, reverse=True
-            )
-            for f in sorted_findings:
-                if f.span and f.redacted_value:
-                    redacted = redacted[: f.span[0]] + f.redacted_value + redacted[f.span[1] :]
+            redacted = redact_spans(text, findings)
 
         return ValidationResult(
             is_valid=len(findings) == 0,
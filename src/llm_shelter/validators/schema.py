@@ -3,15 +3,160 @@
 Validates that LLM output is well-formed JSON conforming to a subset of
 JSON Schema. Useful for enforcing structured output from function-calling
 or tool-use workflows without pulling in a full JSON Schema library.
+
+When the optional ``orjson`` package is installed (``pip install
+llm-shelter[fast]``), documents are parsed with it.
 """
 
 from __future__ import annotations
 
 import json
+import re
+from dataclasses import dataclass
 from typing import Any
 
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _HAVE_ORJSON = False
+
 from llm_shelter.pipeline import Action, Finding, ValidationResult
 
+# orjson silently turns integers wider than 64 bits into floats, which
+# would change how they compare against enum and range constraints.
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+
+_TYPE_MAP: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, preferring orjson when it can represent the document exactly."""
+    if _HAVE_ORJSON and isinstance(text, str) and not _LONG_DIGIT_RUN.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # the stdlib also accepts NaN and Infinity, and reports the error
+    return json.loads(text)
+
+
+@dataclass(slots=True)
+class _SchemaNode:
+    """A schema node with its keywords resolved once, ahead of validation."""
+
+    type_name: str | None
+    python_type: type | tuple[type, ...] | None
+    enum: Any
+    min_length: Any
+    max_length: Any
+    minimum: Any
+    maximum: Any
+    check_length: bool
+    check_range: bool
+    required: tuple[str, ...]
+    required_set: frozenset[str]
+    constrains: bool
+    properties: tuple[tuple[str, _SchemaNode], ...] | None = None
+    items: _SchemaNode | None = None
+
+
+def _items_schema(schema: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the ``items`` sub-schema, or ``None`` when it is not a single schema.
+
+    Tuple validation (a list of schemas) is not supported and, as before,
+    leaves the array items unconstrained.
+    """
+    items = schema.get("items")
+    return items if isinstance(items, dict) else None
+
+
+def _compile_schema(schema: dict[str, Any]) -> _SchemaNode:
+    """Build the :class:`_SchemaNode` tree for *schema*.
+
+    Each distinct sub-schema dict is compiled once, so shared (or even
+    self-referencing) sub-schemas map to the same node. Like validation,
+    this uses an explicit stack rather than recursion. Children whose
+    schema constrains nothing are left out, so validation never visits
+    the values under them.
+    """
+    nodes: dict[int, tuple[_SchemaNode, dict[str, Any]]] = {}
+    pending = [schema]
+    while pending:
+        sub = pending.pop()
+        if id(sub) in nodes:
+            continue
+        get = sub.get
+        expected_type = get("type")
+        min_length = get("minLength")
+        max_length = get("maxLength")
+        minimum = get("minimum")
+        maximum = get("maximum")
+        required = tuple(get("required") or ())
+        properties = get("properties")
+        items = _items_schema(sub)
+        python_type = _TYPE_MAP.get(expected_type) if type(expected_type) is str else None
+        enum = get("enum")
+        nodes[id(sub)] = (
+            _SchemaNode(
+                type_name=expected_type,
+                python_type=python_type,
+                enum=enum,
+                min_length=min_length,
+                max_length=max_length,
+                minimum=minimum,
+                maximum=maximum,
+                check_length=min_length is not None or max_length is not None,
+                check_range=minimum is not None or maximum is not None,
+                required=required,
+                required_set=frozenset(required),
+                constrains=python_type is not None
+                or enum is not None
+                or min_length is not None
+                or max_length is not None
+                or minimum is not None
+                or maximum is not None
+                or properties is not None
+                or items is not None,
+            ),
+            sub,
+        )
+        if properties is not None:
+            pending.extend(properties.values())
+        if items is not None:
+            pending.append(items)
+
+    # Link children only once every dict has a node, so cycles resolve
+    for node, sub in nodes.values():
+        properties = sub.get("properties")
+        if properties is not None:
+            node.properties = tuple(
+                (key, nodes[id(child)][0])
+                for key, child in properties.items()
+                if nodes[id(child)][0].constrains
+            )
+        items = _items_schema(sub)
+        if items is not None and nodes[id(items)][0].constrains:
+            node.items = nodes[id(items)][0]
+    return nodes[id(schema)][0]
+
+
+def _join_path(parent: str, key: str | int | None) -> str:
+    """Return the JSONPath-style location of *key* under *parent*."""
+    if key is None:
+        return parent
+    if type(key) is int:
+        return f"{parent}[{key}]"
+    return f"{parent}.{key}"
+
 
 class SchemaValidator:
     """Validate that text is valid JSON conforming to a simple schema.
@@ -19,6 +164,9 @@ class SchemaValidator:
     Supports a subset of JSON Schema: type, required, properties,
     items, enum, minimum, maximum, minLength, maxLength.
 
+    The schema is compiled when it is assigned. Reassign :attr:`schema`
+    rather than mutating the dict in place for changes to take effect.
+
     Args:
         schema: A dict describing the expected JSON structure.
         action: Action when validation fails.
@@ -34,6 +182,16 @@ class SchemaValidator:
         self.schema = schema
         self.action = action
 
+    @property
+    def schema(self) -> dict[str, Any]:
+        """The JSON schema that documents are validated against."""
+        return self._source
+
+    @schema.setter
+    def schema(self, schema: dict[str, Any]) -> None:
+        self._source = schema
+        self._schema = _compile_schema(schema)
+
     def validate(self, text: str) -> ValidationResult:
         """Parse *text* as JSON and validate it against the configured schema.
 
@@ -48,7 +206,7 @@ class SchemaValidator:
 
         # Try to parse JSON
         try:
-            data = json.loads(text)
+            data = _loads(text)
         except (json.JSONDecodeError, TypeError) as e:
             findings.append(
                 Finding(
@@ -67,7 +225,7 @@ class SchemaValidator:
             )
 
         # Validate against schema
-        errors = self._validate_value(data, self.schema, path="$")
+        errors = self._validate_value(data, self._schema, path="$")
         findings.extend(errors)
 
         return ValidationResult(
@@ -78,100 +236,119 @@ class SchemaValidator:
             action_taken=self.action if findings else Action.PASSTHROUGH,
         )
 
-    def _validate_value(self, value: Any, schema: dict[str, Any], path: str) -> list[Finding]:
-        """Recursively validate a parsed JSON value against a schema node."""
+    def _validate_value(self, value: Any, node: _SchemaNode, path: str) -> list[Finding]:
+        """Validate a parsed JSON value and everything below it against a schema node.
+
+        The tree is walked with an explicit stack instead of recursion, so
+        nesting depth is not bounded by the interpreter's recursion limit.
+        Children are pushed in reverse, which keeps findings in document order.
+        Each entry carries its parent's path and its own key, and the full
+        path string is only built for a finding or for a node with children.
+        """
         errors: list[Finding] = []
-        expected_type = schema.get("type")
-
-        type_map: dict[str, type | tuple[type, ...]] = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
-
-        if expected_type and expected_type in type_map:
-            if not isinstance(value, type_map[expected_type]):
+        stack: list[tuple[Any, _SchemaNode, str, str | int | None]] = [(value, node, path, None)]
+
+        while stack:
+            value, node, parent, key = stack.pop()
+
+            python_type = node.python_type
+            if python_type is not None and not isinstance(value, python_type):
                 errors.append(
                     Finding(
                         validator=self.name,
                         category="type_mismatch",
-                        description=f"{path}: expected {expected_type}, got {type(value).__name__}",
+                        description=(
+                            f"{_join_path(parent, key)}: expected {node.type_name}, "
+                            f"got {type(value).__name__}"
+                        ),
                         severity=0.9,
                     )
                 )
-                return errors
+                continue
 
-        if "enum" in schema and value not in schema["enum"]:
-            errors.append(
-                Finding(
-                    validator=self.name,
-                    category="enum_mismatch",
-                    description=f"{path}: {value!r} not in {schema['enum']}",
-                    severity=0.8,
-                )
-            )
-
-        if isinstance(value, str):
-            if "minLength" in schema and len(value) < schema["minLength"]:
+            enum = node.enum
+            if enum is not None and value not in enum:
                 errors.append(
                     Finding(
                         validator=self.name,
-                        category="min_length",
-                        description=f"{path}: length {len(value)} < {schema['minLength']}",
-                        severity=0.7,
-                    )
-                )
-            if "maxLength" in schema and len(value) > schema["maxLength"]:
-                errors.append(
-                    Finding(
-                        validator=self.name,
-                        category="max_length",
-                        description=f"{path}: length {len(value)} > {schema['maxLength']}",
-                        severity=0.7,
+                        category="enum_mismatch",
+                        description=f"{_join_path(parent, key)}: {value!r} not in {enum}",
+                        severity=0.8,
                     )
                 )
 
-        if isinstance(value, (int, float)) and not isinstance(value, bool):
-            if "minimum" in schema and value < schema["minimum"]:
-                errors.append(
-                    Finding(
-                        validator=self.name,
-                        category="minimum",
-                        description=f"{path}: {value} < {schema['minimum']}",
-                        severity=0.7,
+            if node.check_length and isinstance(value, str):
+                min_length = node.min_length
+                max_length = node.max_length
+                if min_length is not None and len(value) < min_length:
+                    errors.append(
+                        Finding(
+                            validator=self.name,
+                            category="min_length",
+                            description=(
+                                f"{_join_path(parent, key)}: length {len(value)} < {min_length}"
+                            ),
+                            severity=0.7,
+                        )
                     )
-                )
-            if "maximum" in schema and value > schema["maximum"]:
-                errors.append(
-                    Finding(
-                        validator=self.name,
-                        category="maximum",
-                        description=f"{path}: {value} > {schema['maximum']}",
-                        severity=0.7,
+                if max_length is not None and len(value) > max_length:
+                    errors.append(
+                        Finding(
+                            validator=self.name,
+                            category="max_length",
+                            description=(
+                                f"{_join_path(parent, key)}: length {len(value)} > {max_length}"
+                            ),
+                            severity=0.7,
+                        )
                     )
-                )
 
-        if isinstance(value, dict) and "properties" in schema:
-            for key in schema.get("required", []):
-                if key not in value:
+            if node.check_range and isinstance(value, (int, float)) and not isinstance(value, bool):
+                minimum = node.minimum
+                maximum = node.maximum
+                if minimum is not None and value < minimum:
+                    errors.append(
+                        Finding(
+                            validator=self.name,
+                            category="minimum",
+                            description=f"{_join_path(parent, key)}: {value} < {minimum}",
+                            severity=0.7,
+                        )
+                    )
+                if maximum is not None and value > maximum:
                     errors.append(
+                        Finding(
+                            validator=self.name,
+                            category="maximum",
+                            description=f"{_join_path(parent, key)}: {value} > {maximum}",
+                            severity=0.7,
+                        )
+                    )
+
+            properties = node.properties
+            if properties is not None and isinstance(value, dict):
+                # One set difference answers the common all-present case;
+                # only a miss falls back to the list for its ordering.
+                path = _join_path(parent, key)
+                if node.required_set and (missing := node.required_set - value.keys()):
+                    errors.extend(
                         Finding(
                             validator=self.name,
                             category="missing_required",
-                            description=f"{path}: missing required field '{key}'",
+                            description=f"{path}: missing required field '{name}'",
                             severity=0.9,
                         )
+                        for name in node.required
+                        if name in missing
                     )
-            for key, sub_schema in schema["properties"].items():
-                if key in value:
-                    errors.extend(self._validate_value(value[key], sub_schema, f"{path}.{key}"))
+                children = [
+                    (value[name], child, path, name) for name, child in properties if name in value
+                ]
+                stack.extend(reversed(children))
 
-        if isinstance(value, list) and "items" in schema:
-            for i, item in enumerate(value):
-                errors.extend(self._validate_value(item, schema["items"], f"{path}[{i}]"))
+            items = node.items
+            if items is not None and isinstance(value, list):
+                path = _join_path(parent, key)
+                stack.extend((value[i], items, path, i) for i in reversed(range(len(value))))
 
         return errors
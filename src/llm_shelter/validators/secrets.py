@@ -13,6 +13,7 @@ import re
 from dataclasses import dataclass
 
 from llm_shelter.pipeline import Action, Finding, ValidationResult
+from llm_shelter.validators._prefilter import combine_patterns, redact_spans
 
 
 @dataclass
@@ -147,6 +148,10 @@ class SecretsValidator:
             A :class:`~llm_shelter.pipeline.ValidationResult`. When ``redact``
             is enabled, ``result.text`` contains the redacted version.
         """
+        combined = combine_patterns(tuple(secret.pattern for secret in self.patterns))
+        if combined is not None and combined.search(text) is None:
+            return ValidationResult.clean(text)
+
         findings: list[Finding] = []
         claimed: list[tuple[int, int]] = []
         redacted = text
@@ -169,13 +174,7 @@ class SecretsValidator:
                 )
 
         if self.redact and findings:
-            # Redact from right to left to preserve span positions
-            sorted_findings = sorted(
-                findings, key=lambda f: f.span[0] if f.span else 0, reverse=True
-            )
-            for f in sorted_findings:
-                if f.span and f.redacted_value:
-                    redacted = redacted[: f.span[0]] + f.redacted_value + redacted[f.span[1] :]
+            redacted = redact_spans(text, findings)
 
         return ValidationResult(
             is_valid=len(findings) == 0,
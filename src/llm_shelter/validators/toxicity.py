@@ -8,12 +8,15 @@ maximum matched weight meets or exceeds the validator's threshold.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 
 from llm_shelter.pipeline import Action, Finding, ValidationResult
+from llm_shelter.validators._prefilter import possible_matches
 
 
-@dataclass
+@dataclass(slots=True)
 class ToxicityCategory:
     """A group of regex patterns representing one toxicity category.
 
@@ -21,49 +24,85 @@ class ToxicityCategory:
         name: Category identifier (e.g. ``"profanity"``, ``"threats"``).
         patterns: List of compiled regexes that match toxic content in this category.
         weight: Severity weight from 0.0 to 1.0, compared against the validator threshold.
+        anchors: Lowercase literals, at least one of which must appear in any
+            text one of the patterns can match. Used to skip the category on
+            text that contains none of them. Empty means it always runs.
     """
 
     name: str
     patterns: list[re.Pattern[str]]
     weight: float = 1.0
+    anchors: tuple[str, ...] = ()
 
 
 _PROFANITY = ToxicityCategory(
     name="profanity",
     patterns=[
-        re.compile(r"(?i)\b(?:fuck|shit|damn|ass|bitch|crap|dick|piss)\w*\b"),
+        re.compile(r"\b(?:fuck|shit|damn|ass|bitch|crap|dick|piss)\w*\b", re.IGNORECASE),
     ],
     weight=0.6,
+    anchors=("fuck", "shit", "damn", "ass", "bitch", "crap", "dick", "piss"),
 )
 
 _SLURS = ToxicityCategory(
     name="slurs",
     patterns=[
-        re.compile(r"(?i)\b(?:retard(?:ed)?|spaz|cripple)\b"),
+        re.compile(r"\b(?:retard(?:ed)?|spaz|cripple)\b", re.IGNORECASE),
     ],
     weight=0.8,
+    anchors=("retard", "spaz", "cripple"),
 )
 
 _THREATS = ToxicityCategory(
     name="threats",
     patterns=[
-        re.compile(r"(?i)\b(?:i(?:'ll| will))\b.{0,20}\b(?:kill|hurt|destroy|attack|murder)\b"),
-        re.compile(r"(?i)\b(?:bomb|weapon|explosive)\b.{0,20}\b(?:make|build|create|how to)\b"),
-        re.compile(r"(?i)\b(?:how to)\b.{0,20}\b(?:bomb|weapon|explosive|poison|kill)\b"),
+        re.compile(
+            r"\b(?:i(?:'ll| will))\b.{0,20}\b(?:kill|hurt|destroy|attack|murder)\b", re.IGNORECASE
+        ),
+        re.compile(
+            r"\b(?:bomb|weapon|explosive)\b.{0,20}\b(?:make|build|create|how to)\b", re.IGNORECASE
+        ),
+        re.compile(
+            r"\b(?:how to)\b.{0,20}\b(?:bomb|weapon|explosive|poison|kill)\b", re.IGNORECASE
+        ),
     ],
     weight=1.0,
+    anchors=(
+        "kill",
+        "hurt",
+        "destroy",
+        "attack",
+        "murder",
+        "bomb",
+        "weapon",
+        "explosive",
+        "poison",
+    ),
 )
 
 _HARASSMENT = ToxicityCategory(
     name="harassment",
     patterns=[
-        re.compile(r"(?i)\b(?:kys|kill\s*yourself|go\s*die)\b"),
-        re.compile(r"(?i)\byou(?:'re| are)\b.{0,15}\b(?:worthless|pathetic|disgusting|ugly)\b"),
+        re.compile(r"\b(?:kys|kill\s*yourself|go\s*die)\b", re.IGNORECASE),
+        re.compile(
+            r"\byou(?:'re| are)\b.{0,15}\b(?:worthless|pathetic|disgusting|ugly)\b", re.IGNORECASE
+        ),
     ],
     weight=0.9,
+    anchors=("kys", "kill", "die", "worthless", "pathetic", "disgusting", "ugly"),
 )
 
-DEFAULT_CATEGORIES: list[ToxicityCategory] = [_PROFANITY, _SLURS, _THREATS, _HARASSMENT]
+# Non-ASCII letters IGNORECASE matches to "i" that casefold() leaves alone
+_CASEFOLD_MISSES = ("\u0130", "\u0131")
+
+# A tuple so the shared defaults cannot be mutated through a validator
+DEFAULT_CATEGORIES: tuple[ToxicityCategory, ...] = (_PROFANITY, _SLURS, _THREATS, _HARASSMENT)
+
+
+@lru_cache(maxsize=256)
+def _description(name: str) -> str:
+    """Return the shared, interned finding description for category *name*."""
+    return sys.intern(f"Toxic content ({name})")
 
 
 class ToxicityValidator:
@@ -76,6 +115,10 @@ class ToxicityValidator:
     """
 
     name: str = "toxicity"
+    # Candidates found by the last could_match call, handed over to the
+    # validate call that usually follows for the same text object so the
+    # anchor scan runs once per pipeline run.
+    _prefiltered: tuple[str, list[ToxicityCategory]] | None = None
 
     def __init__(
         self,
@@ -83,10 +126,90 @@ class ToxicityValidator:
         threshold: float = 0.5,
         action: Action = Action.BLOCK,
     ) -> None:
-        self.categories = categories or list(DEFAULT_CATEGORIES)
+        # The shared defaults are copied only if the list is asked for
+        self._categories: list[ToxicityCategory] | tuple[ToxicityCategory, ...] = (
+            categories or DEFAULT_CATEGORIES
+        )
         self.threshold = threshold
         self.action = action
 
+    @property
+    def categories(self) -> list[ToxicityCategory]:
+        """The categories this validator checks, as a list callers may modify."""
+        if isinstance(self._categories, tuple):
+            self._categories = list(self._categories)
+        return self._categories
+
+    @categories.setter
+    def categories(self, categories: list[ToxicityCategory]) -> None:
+        self._categories = categories
+
+    def _candidates(self, text: str) -> list[ToxicityCategory]:
+        """Return the categories whose anchors appear in *text*."""
+        categories = self._categories
+        # Categories share roots ("kill"), so each distinct root is searched once
+        anchors = {anchor for cat in categories for anchor in cat.anchors}
+        # casefold() maps every character IGNORECASE equates with an ASCII
+        # letter onto that letter, except the dotted and dotless i. Text with
+        # either of those, or custom non-ASCII anchors, is not prefiltered.
+        if not text.isascii() and (
+            any(char in text for char in _CASEFOLD_MISSES)
+            or not all(anchor.isascii() for anchor in anchors)
+        ):
+            return list(categories)
+        folded = text.casefold()
+        present = {anchor for anchor in anchors if anchor in folded}
+        return [cat for cat in categories if not cat.anchors or not present.isdisjoint(cat.anchors)]
+
+    def could_match(self, text: str) -> bool:
+        """Cheaply check whether :meth:`validate` could report anything for *text*.
+
+        ``False`` guarantees no findings; ``True`` only means a regex has
+        to run.
+        """
+        # A threshold of zero fails every text, matched or not
+        if self.threshold <= 0.0:
+            return True
+        candidates = self._candidates(text)
+        if candidates:
+            self._prefiltered = (text, candidates)
+        return bool(candidates)
+
+    def _take_candidates(self, text: str) -> list[ToxicityCategory]:
+        """Return the candidates for *text*, reusing those :meth:`could_match` found."""
+        handoff, self._prefiltered = self._prefiltered, None
+        if handoff is not None and handoff[0] is text:
+            return handoff[1]
+        return self._candidates(text)
+
+    def _active(self, text: str) -> list[tuple[ToxicityCategory, re.Pattern[str]]]:
+        """Return the (category, pattern) pairs left after both prefilters."""
+        # Anchors rule out whole categories, then one multi-pattern pass
+        # rules out the remaining patterns that cannot match. The prefilter
+        # covers every category so it is compiled once per configuration.
+        categories = self._take_candidates(text)
+        if not categories:
+            return []
+        patterns = tuple(pattern for cat in self._categories for pattern in cat.patterns)
+        may_match = {patterns[i] for i in possible_matches(patterns, text)}
+        return [(cat, p) for cat in categories for p in cat.patterns if p in may_match]
+
+    def _flagged(self, text: str, active: list[tuple[ToxicityCategory, re.Pattern[str]]]) -> bool:
+        """Return whether a category at or above the threshold matches *text*."""
+        threshold = self.threshold
+        # A threshold of zero fails every text, matched or not
+        return threshold <= 0.0 or any(
+            cat.weight >= threshold and pattern.search(text) for cat, pattern in active
+        )
+
+    def fast_check(self, text: str) -> bool:
+        """Return whether *text* is toxic, stopping at the first qualifying match.
+
+        Answers the same question as ``not validate(text).is_valid`` without
+        collecting findings, for callers that only need a yes or no.
+        """
+        return self._flagged(text, self._active(text))
+
     def validate(self, text: str) -> ValidationResult:
         """Scan *text* for toxic content across all categories.
 
@@ -97,29 +220,36 @@ class ToxicityValidator:
             A :class:`~llm_shelter.pipeline.ValidationResult`. Findings are
             only included when the maximum matched weight meets the threshold.
         """
+        # Settle whether the text is flagged with search() first, so findings
+        # are only built for text that actually is
+        active = self._active(text)
+        if not self._flagged(text, active):
+            return ValidationResult.clean(text)
+
         findings: list[Finding] = []
-        max_score: float = 0.0
-
-        for cat in self.categories:
-            for pattern in cat.patterns:
-                for match in pattern.finditer(text):
-                    score = cat.weight
-                    max_score = max(max_score, score)
-                    findings.append(
-                        Finding(
-                            validator=self.name,
-                            category=cat.name,
-                            description=f"Toxic content ({cat.name})",
-                            span=(match.start(), match.end()),
-                            severity=score,
-                        )
+
+        # Per-pattern fields are unpacked once, outside the per-match loop
+        validator = self.name
+        append = findings.append
+        for cat, pattern in active:
+            category = cat.name
+            weight = cat.weight
+            description = _description(category)
+            for match in pattern.finditer(text):
+                append(
+                    Finding(
+                        validator=validator,
+                        category=category,
+                        description=description,
+                        span=match.span(),
+                        severity=weight,
                     )
+                )
 
-        triggered = max_score >= self.threshold
         return ValidationResult(
-            is_valid=not triggered,
+            is_valid=False,
             text=text,
             original_text=text,
-            findings=findings if triggered else [],
-            action_taken=self.action if triggered else Action.PASSTHROUGH,
+            findings=findings,
+            action_taken=self.action,
         )
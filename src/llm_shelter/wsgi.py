@@ -19,6 +19,8 @@ from llm_shelter.pipeline import Action, GuardrailPipeline, ValidationResult
 
 _TEXT_KEYS = ("text", "message", "content", "prompt", "input", "query")
 
+_GUARDED_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
 
 class ShelterWSGIMiddleware:
     """WSGI middleware that runs request bodies through a guardrail pipeline.
@@ -50,7 +52,9 @@ class ShelterWSGIMiddleware:
     ) -> None:
         self.app = app
         self.pipeline = pipeline
-        self.paths = paths
+        # Hashed once so the per-request path check is O(1); an empty list
+        # guards every path, as None does.
+        self.paths: frozenset[str] | None = frozenset(paths) if paths else None
         self.on_block = on_block
 
     def __call__(self, environ: dict[str, Any], start_response: Any) -> Iterable[bytes]:
@@ -58,10 +62,10 @@ class ShelterWSGIMiddleware:
         method = environ.get("REQUEST_METHOD", "GET")
         path = environ.get("PATH_INFO", "")
 
-        if method not in ("POST", "PUT", "PATCH"):
+        if method not in _GUARDED_METHODS:
             return self.app(environ, start_response)  # type: ignore[no-any-return]
 
-        if self.paths and path not in self.paths:
+        if self.paths is not None and path not in self.paths:
             return self.app(environ, start_response)  # type: ignore[no-any-return]
 
         raw_body = self._read_body(environ)
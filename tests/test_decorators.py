@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 
+from llm_shelter.auditlog import AuditLogger
 from llm_shelter.decorators import GuardedCallError, guard_input, guard_output
 from llm_shelter.pipeline import Action, GuardrailPipeline
 from llm_shelter.validators.injection import InjectionValidator
@@ -95,6 +98,18 @@ class TestGuardInput:
         result = call_llm()
         assert result == "no input"
 
+    def test_audited_pipeline_always_runs(self) -> None:
+        stream = io.StringIO()
+        pipeline = GuardrailPipeline(audit=AuditLogger(stream=stream))
+        pipeline.add(InjectionValidator(), Action.BLOCK)
+
+        @guard_input(pipeline)
+        def call_llm(prompt: str) -> str:
+            return prompt
+
+        assert call_llm("hi") == "hi"
+        assert len(stream.getvalue().splitlines()) == 1
+
 
 class TestGuardOutput:
     def test_blocks_toxic_output(self) -> None:
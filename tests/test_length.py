@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-
+from llm_shelter.pipeline import Action, GuardrailPipeline
 from llm_shelter.validators.length import LengthValidator
 
 
@@ -46,6 +46,30 @@ class TestTokenLimit:
         assert not result.is_valid
         assert any(f.category == "max_tokens" for f in result.findings)
 
+    def test_estimates_tokens_once(self) -> None:
+        calls: list[str] = []
+
+        class CountingLength(LengthValidator):
+            def estimate_tokens(self, text: str) -> int:  # type: ignore[override]
+                calls.append(text)
+                return 50
+
+        result = CountingLength(max_tokens=10).validate("long enough")
+        assert not result.is_valid
+        assert calls == ["long enough"]
+
+    def test_estimates_tokens_once_per_pipeline_run(self) -> None:
+        calls: list[str] = []
+
+        class CountingLength(LengthValidator):
+            def estimate_tokens(self, text: str) -> int:  # type: ignore[override]
+                calls.append(text)
+                return 50
+
+        pipeline = GuardrailPipeline().add(CountingLength(max_tokens=10), Action.WARN)
+        assert pipeline.run("long enough").has_findings
+        assert calls == ["long enough"]
+
 
 class TestTokenEstimation:
     def test_estimate_tokens(self) -> None:
@@ -86,3 +110,31 @@ class TestNoLimits:
         v = LengthValidator()
         result = v.validate("x" * 10000)
         assert result.is_valid
+
+
+class TestCouldMatch:
+    def test_within_limits(self) -> None:
+        assert not LengthValidator(max_chars=100).could_match("short")
+
+    def test_token_limit_defers_to_validate(self) -> None:
+        # Estimating tokens here would run the tokeniser twice per run()
+        assert LengthValidator(max_chars=100, max_tokens=50).could_match("short")
+
+    def test_over_limit(self) -> None:
+        assert LengthValidator(max_chars=3).could_match("too long")
+        assert LengthValidator(max_tokens=1).could_match("a" * 40)
+
+
+class TestValidateBytes:
+    def test_definitely_over_limit(self) -> None:
+        result = LengthValidator(max_chars=10).validate_bytes(b"x" * 41)
+        assert result is not None
+        assert not result.is_valid
+        assert result.findings[0].category == "max_chars"
+
+    def test_undetermined_without_decoding(self) -> None:
+        # 40 bytes could be 10 four-byte characters, so the text must be decoded.
+        assert LengthValidator(max_chars=10).validate_bytes(b"x" * 40) is None
+
+    def test_no_char_limit(self) -> None:
+        assert LengthValidator(max_tokens=1).validate_bytes(b"x" * 1000) is None
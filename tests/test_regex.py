@@ -160,12 +160,28 @@ class TestRegexValidator:
         assert result.text == "[ID_REDACTED] met [ID_REDACTED] and [ID_REDACTED]"
         assert len(result.findings) == 3
 
+    def test_partially_overlapping_rules_fully_redacted(self) -> None:
+        v = RegexValidator.from_specs([r"a=secret-\w+", r"b=\w+-token-\d+"])
+        result = v.validate("x secret-abc-token-123456 y")
+        assert result.text == "x [A_REDACTED] y"
+        assert "token" not in result.text and "123456" not in result.text
+        assert len(result.findings) == 2
+
     def test_multiple_patterns(self) -> None:
         v = RegexValidator.from_specs([r"emp=EMP-\d+", r"ticket=JIRA-\d+"])
         result = v.validate("EMP-9 fixed JIRA-7")
         categories = {f.category for f in result.findings}
         assert categories == {"emp", "ticket"}
 
+    def test_falls_back_when_patterns_uncombinable(self) -> None:
+        v = RegexValidator(
+            [
+                RegexPattern(name="a", pattern=re.compile(r"(?P<x>aa)")),
+                RegexPattern(name="b", pattern=re.compile(r"(?P<x>bb)")),
+            ]
+        )
+        assert {f.category for f in v.validate("aa bb").findings} == {"a", "b"}
+
     def test_clean_text_passes(self) -> None:
         v = RegexValidator.from_specs([r"emp=EMP-\d+"])
         result = v.validate("nothing sensitive here")
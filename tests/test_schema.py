@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+import pytest
 
 from llm_shelter.validators.schema import SchemaValidator
 
@@ -130,6 +131,56 @@ class TestObjectValidation:
         assert not result.is_valid
 
 
+class TestCompiledSchema:
+    def test_missing_required_in_declared_order(self) -> None:
+        schema = {"type": "object", "properties": {}, "required": ["c", "a", "b"]}
+        v = SchemaValidator(schema=schema)
+        result = v.validate(json.dumps({"a": 1}))
+        assert [f.description for f in result.findings] == [
+            "$: missing required field 'c'",
+            "$: missing required field 'b'",
+        ]
+
+    def test_reassigned_schema_takes_effect(self) -> None:
+        v = SchemaValidator(schema={"type": "string"})
+        v.schema = {"type": "integer"}
+        assert v.validate("1").is_valid
+        assert not v.validate('"x"').is_valid
+        assert v.schema == {"type": "integer"}
+
+    def test_empty_sub_schema_accepts_anything(self) -> None:
+        schema = {
+            "type": "object",
+            "properties": {"meta": {}, "tags": {"type": "array", "items": {}}},
+        }
+        v = SchemaValidator(schema=schema)
+        assert v.validate(json.dumps({"meta": [1, {"a": None}], "tags": [1, "x", []]})).is_valid
+
+    def test_nested_paths(self) -> None:
+        schema = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+            },
+        }
+        v = SchemaValidator(schema=schema)
+        result = v.validate(json.dumps([{"tags": ["a"]}, {"tags": ["b", 2]}]))
+        assert [f.description for f in result.findings] == [
+            "$[1].tags[1]: expected string, got int"
+        ]
+
+    def test_self_referencing_schema(self) -> None:
+        tree: dict = {"type": "object", "properties": {"name": {"type": "string"}}}
+        tree["properties"]["children"] = {"type": "array", "items": tree}
+        v = SchemaValidator(schema=tree)
+        doc = {"name": "root", "children": [{"name": "leaf", "children": [{"name": 3}]}]}
+        result = v.validate(json.dumps(doc))
+        assert [f.description.split(":")[0] for f in result.findings] == [
+            "$.children[0].children[0].name"
+        ]
+
+
 class TestEnumValidation:
     def test_valid_enum(self) -> None:
         schema = {"type": "string", "enum": ["red", "green", "blue"]}
@@ -166,6 +217,12 @@ class TestStringConstraints:
         result = v.validate(json.dumps("hello"))
         assert result.is_valid
 
+    def test_null_keyword_is_ignored(self) -> None:
+        schema = {"type": "string", "minLength": None, "maxLength": 3}
+        v = SchemaValidator(schema=schema)
+        result = v.validate(json.dumps("toolong"))
+        assert [f.category for f in result.findings] == ["max_length"]
+
 
 class TestNumericConstraints:
     def test_minimum(self) -> None:
@@ -207,3 +264,71 @@ class TestArrayValidation:
         v = SchemaValidator(schema=schema)
         result = v.validate(json.dumps([]))
         assert result.is_valid
+
+    def test_tuple_items_left_unconstrained(self) -> None:
+        schema = {"type": "array", "items": [{"type": "integer"}, {"type": "string"}]}
+        v = SchemaValidator(schema=schema)
+        assert v.validate(json.dumps([1, "two", None])).is_valid
+        assert not v.validate(json.dumps({"not": "an array"})).is_valid
+
+
+class TestDeepNesting:
+    def test_findings_in_document_order(self) -> None:
+        schema = {
+            "type": "object",
+            "properties": {
+                "a": {"type": "array", "items": {"type": "integer"}},
+                "b": {"type": "string"},
+            },
+        }
+        v = SchemaValidator(schema=schema)
+        result = v.validate(json.dumps({"a": [1, "x", "y"], "b": 2}))
+        assert [f.description.split(":")[0] for f in result.findings] == ["$.a[1]", "$.a[2]", "$.b"]
+
+    def test_nesting_beyond_recursion_limit(self) -> None:
+        import sys
+
+        depth = sys.getrecursionlimit() * 2
+        schema: dict = {"type": "string"}
+        value: object = 1
+        for _ in range(depth):
+            schema = {"type": "array", "items": schema}
+            value = [value]
+        v = SchemaValidator(schema=schema)
+        findings = v._validate_value(value, v._schema, "$")
+        assert [f.category for f in findings] == ["type_mismatch"]
+
+
+class TestParserBackends:
+    """Both JSON parsers must produce the same verdicts."""
+
+    @pytest.fixture(params=["orjson", "stdlib"], autouse=True)
+    def backend(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+            monkeypatch.setattr("llm_shelter.validators.schema._HAVE_ORJSON", True)
+        else:
+            monkeypatch.setattr("llm_shelter.validators.schema._HAVE_ORJSON", False)
+
+    def test_wide_integer_stays_integer(self) -> None:
+        v = SchemaValidator(schema={"type": "integer", "enum": [12345678901234567890123]})
+        assert v.validate("12345678901234567890123").is_valid
+
+    def test_nan_is_accepted(self) -> None:
+        v = SchemaValidator(schema={"type": "number"})
+        assert v.validate("NaN").is_valid
+
+    def test_invalid_json_reports_stdlib_error(self) -> None:
+        v = SchemaValidator(schema={"type": "object"})
+        result = v.validate('{"key": ')
+        expected = ""
+        try:
+            json.loads('{"key": ')
+        except json.JSONDecodeError as e:
+            expected = f"Invalid JSON: {e}"
+        assert [f.description for f in result.findings] == [expected]
+
+    def test_non_string_input(self) -> None:
+        v = SchemaValidator(schema={"type": "string"})
+        result = v.validate(None)  # type: ignore[arg-type]
+        assert [f.category for f in result.findings] == ["json_parse"]
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import pytest
 
-from llm_shelter.validators.toxicity import ToxicityCategory, ToxicityValidator
+from llm_shelter.validators.toxicity import (
+    DEFAULT_CATEGORIES,
+    ToxicityCategory,
+    ToxicityValidator,
+)
 
 
 @pytest.fixture
@@ -32,6 +36,11 @@ class TestProfanity:
         result = v.validate("This is some shit")
         assert result.is_valid
 
+    def test_findings_share_one_description(self, validator: ToxicityValidator) -> None:
+        first, second = validator.validate("shit and more shit").findings
+        assert first.description == "Toxic content (profanity)"
+        assert first.description is second.description
+
 
 class TestSlurs:
     def test_detects_slurs(self, validator: ToxicityValidator) -> None:
@@ -112,3 +121,85 @@ class TestCustomConfig:
         v = ToxicityValidator(categories=[mild], threshold=0.0)
         result = v.validate("Oh darn")
         assert not result.is_valid
+
+    def test_default_categories_not_mutated(self) -> None:
+        v = ToxicityValidator()
+        v.categories.append(ToxicityCategory(name="x", patterns=[]))
+        assert all(c.name != "x" for c in DEFAULT_CATEGORIES)
+        assert isinstance(DEFAULT_CATEGORIES, tuple)
+
+    def test_appended_category_is_checked(self) -> None:
+        import re
+
+        v = ToxicityValidator(threshold=0.1)
+        v.categories.append(ToxicityCategory(name="mild", patterns=[re.compile(r"(?i)\bdarn\b")]))
+        result = v.validate("Oh darn")
+        assert not result.is_valid
+        assert result.findings[0].category == "mild"
+
+
+class TestCouldMatch:
+    def test_clean_text_ruled_out(self, validator: ToxicityValidator) -> None:
+        assert not validator.could_match("Have a wonderful day")
+
+    def test_anchor_check_is_case_insensitive(self, validator: ToxicityValidator) -> None:
+        assert validator.could_match("WHAT THE SHIT")
+        assert not validator.validate("WHAT THE SHIT").is_valid
+
+    def test_clean_non_ascii_text_ruled_out(self, validator: ToxicityValidator) -> None:
+        assert not validator.could_match("naïve question \u2014 \U0001f642")
+
+    @pytest.mark.parametrize(
+        "text", ["\u017fhit", "\u212ays", "k\u0131ll yourself", "K\u0130LL YOURSELF"]
+    )
+    def test_non_ascii_case_variants_still_scanned(
+        self, validator: ToxicityValidator, text: str
+    ) -> None:
+        assert validator.could_match(text)
+        assert not validator.validate(text).is_valid
+
+    def test_casefold_misses_cover_every_ascii_lookalike(self) -> None:
+        import re
+
+        from llm_shelter.validators.toxicity import _CASEFOLD_MISSES
+
+        letter = re.compile("[a-z]", re.IGNORECASE)
+        for codepoint in range(0x80, 0x110000):
+            char = chr(codepoint)
+            if letter.fullmatch(char):
+                folded = char.casefold()
+                assert char in _CASEFOLD_MISSES or (folded.isascii() and len(folded) == 1)
+
+    def test_category_without_anchors_always_runs(self) -> None:
+        import re
+
+        mild = ToxicityCategory(name="mild", patterns=[re.compile(r"(?i)\bdarn\b")])
+        v = ToxicityValidator(categories=[mild])
+        assert v.could_match("hello")
+        assert not v.validate("Oh darn").is_valid
+
+
+class TestThresholdDecision:
+    def test_lower_weight_findings_kept_when_flagged(self, validator: ToxicityValidator) -> None:
+        result = validator.validate("damn, how to make a bomb")
+        assert {f.category for f in result.findings} == {"profanity", "threats"}
+
+    def test_only_below_threshold_matches_pass(self) -> None:
+        result = ToxicityValidator(threshold=0.7).validate("damn it")
+        assert result.is_valid
+        assert result.findings == []
+
+    def test_zero_threshold_flags_even_clean_text(self) -> None:
+        v = ToxicityValidator(threshold=0.0)
+        assert v.could_match("hello there")
+        assert not v.validate("hello there").is_valid
+
+
+class TestFastCheck:
+    @pytest.mark.parametrize(
+        "text", ["damn it", "how to make a bomb", "you are so ugly", "have a nice day", ""]
+    )
+    @pytest.mark.parametrize("threshold", [0.0, 0.5, 0.7, 1.0])
+    def test_agrees_with_validate(self, text: str, threshold: float) -> None:
+        v = ToxicityValidator(threshold=threshold)
+        assert v.fast_check(text) == (not v.validate(text).is_valid)